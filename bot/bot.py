@@ -4,7 +4,7 @@ import socket
 import warnings
 from collections import defaultdict
 from contextlib import suppress
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import aiohttp
 import discord
@@ -43,6 +43,7 @@ class Bot(commands.Bot):
         self.redis_session = redis_session
         self.api_client: Optional[api.APIClient] = None
         self.filter_list_cache = defaultdict(dict)
+        self.filter_list_rendered_cache: Dict[Tuple[str, bool], List[str]] = {}
 
         self._connector = None
         self._resolver = None
@@ -215,8 +216,10 @@ class Bot(commands.Bot):
         type_ = item["type"]
         allowed = item["allowed"]
         content = item["content"]
+        key = (type_, allowed)
 
-        self.filter_list_cache[f"{type_}.{allowed}"][content] = {
+        self.filter_list_rendered_cache.pop(key, None)
+        self.filter_list_cache[key][content] = {
             "id": item["id"],
             "comment": item["comment"],
             "created_at": item["created_at"],
@@ -40,7 +40,7 @@ class AntiMalware(Cog):
 
     def _get_whitelisted_file_formats(self) -> list:
         """Get the file formats currently on the whitelist."""
-        return self.bot.filter_list_cache['FILE_FORMAT.True'].keys()
+        return self.bot.filter_list_cache[('FILE_FORMAT', True)].keys()
 
     def _get_disallowed_extensions(self, message: Message) -> t.Iterable[str]:
         """Get an iterable containing all the disallowed extensions of attachments."""
@@ -1,5 +1,6 @@
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from discord import Colour, Embed
 from discord.ext.commands import BadArgument, Cog, Context, IDConverter, group, has_any_role
@@ -12,6 +13,17 @@ from bot.pagination import LinePaginator
 
 log = logging.getLogger(__name__)
 
+_ALLOW_TYPE = ("blacklist", "whitelist")
+_ID_CONVERTER = IDConverter()
+_INVITE_VALIDATOR = ValidDiscordServerInvite()
+
+
+@lru_cache(maxsize=None)
+def _title_for(list_type: str, allowed: bool) -> str:
+    """Return the embed title prefix for a filterlist, e.g. `Whitelisted Guild Invites `."""
+    list_type_plural = list_type.lower().replace("_", " ").title() + "s"
+    return f"{_ALLOW_TYPE[allowed].title()}ed {list_type_plural} "
+
 
 class FilterLists(Cog):
     """Commands for blacklisting and whitelisting things."""
@@ -52,26 +64,11 @@ class FilterLists(Cog):
         comment: Optional[str] = None,
     ) -> None:
         """Add an item to a filterlist."""
-        allow_type = "whitelist" if allowed else "blacklist"
-
-        # If this is a server invite, we gotta validate it.
-        if list_type == "GUILD_INVITE":
-            guild_data = await self._validate_guild_invite(ctx, content)
-            content = guild_data.get("id")
-
-            # Unless the user has specified another comment, let's
-            # use the server name as the comment so that the list
-            # of guild IDs will be more easily readable when we
-            # display it.
-            if not comment:
-                comment = guild_data.get("name")
-
-        # If it's a file format, let's make sure it has a leading dot.
-        elif list_type == "FILE_FORMAT" and not content.startswith("."):
-            content = f".{content}"
+        allow_type = _ALLOW_TYPE[allowed]
+        content, comment = await self._resolve_content(ctx, list_type, content, comment)
 
         # Try to add the item to the database
-        log.trace(f"Trying to add the {content} item to the {list_type} {allow_type}")
+        log.trace("Trying to add the %s item to the %s %s", content, list_type, allow_type)
         payload = {
             "allowed": allowed,
             "type": list_type,
@@ -105,27 +102,22 @@ class FilterLists(Cog):
 
     async def _delete_data(self, ctx: Context, allowed: bool, list_type: ValidFilterListType, content: str) -> None:
         """Remove an item from a filterlist."""
-        allow_type = "whitelist" if allowed else "blacklist"
-
-        # If this is a server invite, we need to convert it.
-        if list_type == "GUILD_INVITE" and not IDConverter()._get_id_match(content):
-            guild_data = await self._validate_guild_invite(ctx, content)
-            content = guild_data.get("id")
-
-        # If it's a file format, let's make sure it has a leading dot.
-        elif list_type == "FILE_FORMAT" and not content.startswith("."):
-            content = f".{content}"
+        allow_type = _ALLOW_TYPE[allowed]
+        content, _ = await self._resolve_content(ctx, list_type, content)
 
         # Find the content and delete it.
-        log.trace(f"Trying to delete the {content} item from the {list_type} {allow_type}")
-        item = self.bot.filter_list_cache[f"{list_type}.{allowed}"].get(content)
+        log.trace("Trying to delete the %s item from the %s %s", content, list_type, allow_type)
+        key = (list_type, allowed)
+        cache = self.bot.filter_list_cache[key]
+        item = cache.get(content)
 
         if item is not None:
             try:
                 await self.bot.api_client.delete(
                     f"bot/filter-lists/{item['id']}"
                 )
-                del self.bot.filter_list_cache[f"{list_type}.{allowed}"][content]
+                cache.pop(content, None)
+                self.bot.filter_list_rendered_cache.pop(key, None)
                 await ctx.message.add_reaction("✅")
             except ResponseCodeError as e:
                 log.debug(
@@ -138,27 +130,26 @@ class FilterLists(Cog):
 
     async def _list_all_data(self, ctx: Context, allowed: bool, list_type: ValidFilterListType) -> None:
         """Paginate and display all items in a filterlist."""
-        allow_type = "whitelist" if allowed else "blacklist"
-        result = self.bot.filter_list_cache[f"{list_type}.{allowed}"]
-
-        # Build a list of lines we want to show in the paginator
-        lines = []
-        for content, metadata in result.items():
-            line = f"• `{content}`"
-
-            if comment := metadata.get("comment"):
-                line += f" - {comment}"
-
-            lines.append(line)
-        lines = sorted(lines)
+        allow_type = _ALLOW_TYPE[allowed]
+        key = (list_type, allowed)
+        result = self.bot.filter_list_cache[key]
+
+        # Build the list of lines we want to show in the paginator, unless
+        # it was already rendered since the filterlist last changed.
+        lines = self.bot.filter_list_rendered_cache.get(key)
+        if lines is None:
+            lines = [
+                f"• `{content}`" + (f" - {comment}" if comment else "")
+                for content, comment in ((content, result[content].get("comment")) for content in sorted(result))
+            ]
+            self.bot.filter_list_rendered_cache[key] = lines
 
         # Build the embed
-        list_type_plural = list_type.lower().replace("_", " ").title() + "s"
         embed = Embed(
-            title=f"{allow_type.title()}ed {list_type_plural} ({len(result)} total)",
+            title=f"{_title_for(list_type, allowed)}({len(result)} total)",
             colour=Colour.blue()
         )
-        log.trace(f"Trying to list {len(result)} items from the {list_type.lower()} {allow_type}")
+        log.trace("Trying to list %d items from the %s %s", len(result), list_type.lower(), allow_type)
 
         if result:
             await LinePaginator.paginate(lines, ctx, embed, max_lines=15, empty=False)
@@ -180,6 +171,30 @@ class FilterLists(Cog):
             )
             await ctx.message.add_reaction("❌")
 
+    async def _resolve_content(
+        self,
+        ctx: Context,
+        list_type: ValidFilterListType,
+        content: str,
+        comment: Optional[str] = None,
+    ) -> Tuple[str, Optional[str]]:
+        """Normalise the content of a filterlist item, returning the content and comment to use for it."""
+        # If this is a server invite, we gotta convert it, unless it's already a guild ID.
+        if list_type == "GUILD_INVITE" and not _ID_CONVERTER._get_id_match(content):
+            guild_data = await self._validate_guild_invite(ctx, content)
+
+            # Unless the user has specified another comment, let's
+            # use the server name as the comment so that the list
+            # of guild IDs will be more easily readable when we
+            # display it.
+            return guild_data["id"], comment or guild_data["name"]
+
+        # If it's a file format, let's make sure it has a leading dot.
+        if list_type == "FILE_FORMAT" and not content.startswith("."):
+            return f".{content}", comment
+
+        return content, comment
+
     @staticmethod
     async def _validate_guild_invite(ctx: Context, invite: str) -> dict:
         """
@@ -187,13 +202,12 @@ class FilterLists(Cog):
 
         Will raise a BadArgument if the guild invite is invalid.
         """
-        log.trace(f"Attempting to validate whether or not {invite} is a guild invite.")
-        validator = ValidDiscordServerInvite()
-        guild_data = await validator.convert(ctx, invite)
+        log.trace("Attempting to validate whether or not %s is a guild invite.", invite)
+        guild_data = await _INVITE_VALIDATOR.convert(ctx, invite)
 
         # If we make it this far without raising a BadArgument, the invite is
         # valid. Let's return a dict of guild information.
-        log.trace(f"{invite} validated as server invite. Converting to ID.")
+        log.trace("%s validated as server invite. Converting to ID.", invite)
         return guild_data
 
     @group(aliases=("allowlist", "allow", "al", "wl"))
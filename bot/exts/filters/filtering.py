@@ -140,11 +140,11 @@ class Filtering(Cog):
 
     def _get_filterlist_items(self, list_type: str, *, allowed: bool) -> list:
         """Fetch items from the filter_list_cache."""
-        return self.bot.filter_list_cache[f"{list_type.upper()}.{allowed}"].keys()
+        return self.bot.filter_list_cache[(list_type.upper(), allowed)].keys()
 
     def _get_filterlist_value(self, list_type: str, value: Any, *, allowed: bool) -> dict:
         """Fetch one specific value from filter_list_cache."""
-        return self.bot.filter_list_cache[f"{list_type.upper()}.{allowed}"][value]
+        return self.bot.filter_list_cache[(list_type.upper(), allowed)][value]
 
     @staticmethod
     def _expand_spoilers(text: str) -> str:
@@ -15,7 +15,7 @@ class AntiMalwareCogTests(unittest.IsolatedAsyncioTestCase):
         """Sets up fresh objects for each test."""
         self.bot = MockBot()
         self.bot.filter_list_cache = {
-            "FILE_FORMAT.True": {
+            ("FILE_FORMAT", True): {
                 ".first": {},
                 ".second": {},
                 ".third": {},